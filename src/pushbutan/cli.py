@@ -1,33 +1,43 @@
 import click
-from .pushbutan import Pushbutan, PushbutanError, InstanceType
 from typing import Optional
+import asyncio
+import functools
+from datetime import datetime, timezone
 import logging
+import os
 import sys
+try:
+    import uvloop
+except ImportError:
+    # uvloop isn't available on Windows; commands use the default asyncio loop
+    uvloop = None
+
+# Commands import .pushbutan when they run: the client pulls in githubkit and
+# pydantic, which dominate startup time, and isn't needed when a daemon is running
+from .errors import PushbutanError
+from .types import InstanceType, INSTANCE_TYPES
+
+class _SplitHandler(logging.Handler):
+    """Log handler writing INFO and below to stdout, WARNING and above to stderr"""
+    def emit(self, record: logging.LogRecord):
+        try:
+            stream = sys.stderr if record.levelno >= logging.WARNING else sys.stdout
+            stream.write(self.format(record) + "\n")
+            stream.flush()
+        except Exception:
+            self.handleError(record)
 
 # Configure logging for both CLI and library
 def setup_logging(verbose: bool = False):
     """Configure logging for the CLI and library"""
-    # Create handlers for stdout and stderr
-    stdout_handler = logging.StreamHandler(sys.stdout)
-    stderr_handler = logging.StreamHandler(sys.stderr)
-
-    # Set format
-    formatter = logging.Formatter('%(message)s')  # Simple format for CLI
-    stdout_handler.setFormatter(formatter)
-    stderr_handler.setFormatter(formatter)
-
-    # Configure stdout handler for INFO and below
-    stdout_handler.setLevel(logging.INFO)
-    stdout_handler.addFilter(lambda record: record.levelno <= logging.INFO)
-
-    # Configure stderr handler for WARNING and above
-    stderr_handler.setLevel(logging.WARNING)
+    # One handler routes each record to stdout or stderr by level
+    handler = _SplitHandler(logging.INFO)
+    handler.setFormatter(logging.Formatter('%(message)s'))  # Simple format for CLI
 
     # Get the root logger and configure it
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO if verbose else logging.INFO)
-    root_logger.addHandler(stdout_handler)
-    root_logger.addHandler(stderr_handler)
+    root_logger.addHandler(handler)
 
     # Also configure the pushbutan logger specifically
     pushbutan_logger = logging.getLogger('pushbutan')
@@ -36,85 +46,128 @@ def setup_logging(verbose: bool = False):
 # Create logger for CLI
 log = logging.getLogger(__name__)
 
+def coro(f):
+    """Run an async Click command to completion on a fresh event loop"""
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        async def run():
+            from .daemon import close_client
+            try:
+                return await f(*args, **kwargs)
+            finally:
+                await close_client()
+        return (uvloop.run if uvloop else asyncio.run)(run())
+    return wrapper
+
 @click.group()
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
 def cli(verbose: bool):
     """Pushbutan CLI - Manage GPU instances in rocket-platform"""
     setup_logging(verbose)
 
+def _format_last_run(run) -> str:
+    """Describe a workflow's most recent run for the list output"""
+    if isinstance(run, Exception):
+        return f"last run unavailable: {run}"
+    if run is None:
+        return "no runs"
+
+    # A daemon sends created_at as an ISO 8601 string rather than a datetime
+    created_at = run.created_at
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    return f"last run {run.id}: {run.conclusion or run.status} ({created_at.astimezone(timezone.utc):%Y-%m-%d %H:%M:%S} UTC)"
+
 @cli.command()
-def list():
+@click.option('--last-run', is_flag=True, help='Show the most recent run of each workflow')
+@coro
+async def list(last_run: bool):
     """List available workflows"""
+    from .daemon import get_client
+
     try:
-        pb = Pushbutan()
-        workflows = pb.list_workflows()
-        click.echo("\nAvailable workflows:")
-        for workflow in workflows:
-            click.echo(f"- {workflow.name} (ID: {workflow.id})")
+        pb = await get_client()
+        workflows = await pb.list_workflows()
+        lines = [f"- {workflow.name} (ID: {workflow.id})" for workflow in workflows]
+        if last_run:
+            # Fetch every workflow's latest run concurrently rather than one round trip at a time
+            runs = await asyncio.gather(
+                *(pb.get_latest_workflow_run(workflow.id) for workflow in workflows),
+                return_exceptions=True
+            )
+            lines = [f"{line} - {_format_last_run(run)}" for line, run in zip(lines, runs)]
+        click.echo("\nAvailable workflows:\n" + "\n".join(lines))
     except PushbutanError as e:
-        click.echo(f"Error: {e}", err=True)
-        exit(1)
+        raise click.ClickException(str(e))
 
 @cli.command()
-@click.option('--instance-type', type=click.Choice(['g4dn.4xlarge', 'p3.2xlarge']),
+@click.option('--instance-type', type=click.Choice(INSTANCE_TYPES),
               default='g4dn.4xlarge', help='EC2 instance type')
 @click.option('--lifetime', default='24', help='Instance lifetime in hours')
 @click.option('--windows/--linux', default=False, help='Create Windows instance instead of Linux')
 @click.option('--save-logs', is_flag=True, help='Save workflow logs to disk for debugging')
-def start(instance_type: InstanceType, lifetime: str, windows: bool, save_logs: bool):
+@coro
+async def start(instance_type: InstanceType, lifetime: str, windows: bool, save_logs: bool):
     """Start a new GPU instance"""
-    try:
-        pb = Pushbutan()
+    from .daemon import get_client
 
+    try:
+        pb = await get_client()
         if windows:
             click.echo("\nStarting Windows GPU instance...")
-            result = pb.trigger_windows_gpu_instance(
+            result = await pb.trigger_windows_gpu_instance(
                 instance_type=instance_type,
                 lifetime=lifetime
             )
         else:
             click.echo("\nStarting Linux GPU instance...")
-            result = pb.trigger_linux_gpu_instance(
+            result = await pb.trigger_linux_gpu_instance(
                 instance_type=instance_type,
                 lifetime=lifetime
             )
 
         # Print initial workflow information
-        click.echo("\nWorkflow triggered:")
-        click.echo(f"Run ID: {result['run_id']}")
-        click.echo(f"Status: {result['status']}")
-        click.echo(f"Created at: {result['created_at']}")
-        click.echo(f"URL: {result['html_url']}")
+        click.echo(
+            "\nWorkflow triggered:\n"
+            f"Run ID: {result['run_id']}\n"
+            f"Status: {result['status']}\n"
+            f"Created at: {result['created_at']}\n"
+            f"URL: {result['html_url']}"
+        )
 
         # Wait for the instance
-        instance = pb.wait_for_instance(result["run_id"], parse_logs=True, save_logs=save_logs)
+        # Paths are absolute, since a daemon resolves relative ones in its own directory
+        instance = await pb.wait_for_instance(result["run_id"], parse_logs=True, save_logs=save_logs,
+                                              logs_dir=os.path.abspath('logs'))
 
-        click.echo("\nInstance ready!")
-        click.echo(f"Instance ID: {instance['instance_id']}")
-        click.echo(f"IP Address: {instance['ip_address']}")
-        click.echo(f"Instance Type: {instance['instance_type']}")
+        click.echo(
+            "\nInstance ready!\n"
+            f"Instance ID: {instance['instance_id']}\n"
+            f"IP Address: {instance['ip_address']}\n"
+            f"Instance Type: {instance['instance_type']}"
+        )
 
     except PushbutanError as e:
-        click.echo(f"Error: {e}", err=True)
-        exit(1)
+        raise click.ClickException(str(e))
 
 @cli.command()
 @click.argument('instance-id')
-def stop(instance_id: str):
+@coro
+async def stop(instance_id: str):
     """Stop a running instance"""
-    try:
-        pb = Pushbutan()
+    from .daemon import get_client
 
+    try:
+        pb = await get_client()
         click.echo(f"\nStopping instance {instance_id}...")
-        stop_result = pb.stop_instance(instance_id)
+        stop_result = await pb.stop_instance(instance_id)
 
         # Wait for stop completion without parsing logs
-        pb.wait_for_instance(stop_result["run_id"], parse_logs=False)
+        await pb.wait_for_instance(stop_result["run_id"], parse_logs=False)
         click.echo("\nInstance stop workflow completed!")
 
     except PushbutanError as e:
-        click.echo(f"Error: {e}", err=True)
-        exit(1)
+        raise click.ClickException(str(e))
 
 @cli.command()
 @click.option('--inspect', is_flag=True, help='Show workflow details and expected inputs')
@@ -126,22 +179,26 @@ def stop(instance_id: str):
 @click.option('--download-dir', help='Directory to save signed packages')
 @click.option('--save-logs', is_flag=True, help='Save workflow logs for debugging')
 @click.option('--timeout', default=180, help='Timeout in minutes (default: 180)')
-def codesign(inspect: bool, cert: str, channel: str, package: Optional[str],
-            generate_repodata: bool, download_dir: Optional[str], save_logs: bool, timeout: int):
+@coro
+async def codesign(inspect: bool, cert: str, channel: str, package: Optional[str],
+                   generate_repodata: bool, download_dir: Optional[str], save_logs: bool, timeout: int):
     """Trigger Windows package codesigning workflow"""
-    try:
-        pb = Pushbutan()
+    from .daemon import get_client
 
+    try:
+        pb = await get_client()
         if inspect:
-            details = pb.inspect_codesign_workflow()
-            click.echo("\nCodesign Workflow Details:")
-            click.echo(f"Name: {details['name']}")
-            click.echo(f"ID: {details['id']}")
-            click.echo("\nWorkflow Content:")
-            click.echo(details['content'])
+            details = await pb.inspect_codesign_workflow()
+            click.echo(
+                "\nCodesign Workflow Details:\n"
+                f"Name: {details['name']}\n"
+                f"ID: {details['id']}\n"
+                "\nWorkflow Content:\n"
+                f"{details['content']}"
+            )
         else:
             click.echo("\nTriggering codesign workflow...")
-            result = pb.trigger_codesign(
+            result = await pb.trigger_codesign(
                 cert=cert,
                 org_channel=channel,
                 package_spec=package,
@@ -153,21 +210,34 @@ def codesign(inspect: bool, cert: str, channel: str, package: Optional[str],
             click.echo(f"Workflow triggered successfully (Run ID: {run_id})")
 
             # Wait for completion with longer timeout
-            pb.wait_for_instance(run_id, parse_logs=False, save_logs=save_logs, timeout_minutes=timeout)
+            await pb.wait_for_instance(run_id, parse_logs=False, save_logs=save_logs, timeout_minutes=timeout,
+                                       logs_dir=os.path.abspath('logs'))
             click.echo("\nCodesign workflow completed!")
 
             # Download artifacts if requested
             if download_dir:
-                artifact_path = pb.download_workflow_artifact(
+                artifact_path = await pb.download_workflow_artifact(
                     run_id=run_id,
                     artifact_name="signed-packages",
-                    download_dir=download_dir
+                    download_dir=os.path.abspath(download_dir)
                 )
                 click.echo(f"\nSigned packages downloaded to: {artifact_path}")
 
     except PushbutanError as e:
-        click.echo(f"Error: {e}", err=True)
-        exit(1)
+        raise click.ClickException(str(e))
+
+@cli.command()
+@coro
+async def daemon():
+    """Keep a GitHub client warm for other pushbutan commands to use"""
+    from .daemon import serve
+
+    if not hasattr(asyncio, "start_unix_server"):
+        raise click.ClickException("The daemon needs Unix socket support, which this platform lacks")
+    try:
+        await serve()
+    except PushbutanError as e:
+        raise click.ClickException(str(e))
 
 def main():
     """CLI entry point"""
@@ -0,0 +1,225 @@
+"""
+pushbutan daemon - keep one warm Pushbutan client behind a Unix socket
+
+Running ``pushbutan daemon`` holds a single Pushbutan client (imports, HTTP
+connection pool, cached login) open, and CLI commands forward their calls to
+it as newline-delimited JSON instead of starting a client of their own. When
+no daemon is running, or it was started with a different token, the CLI
+falls back to an in-process client.
+
+This module is imported by every CLI command, so it is kept free of heavy
+imports; the GitHub client is only loaded by the daemon itself or by the
+in-process fallback.
+"""
+
+import asyncio
+import contextvars
+import functools
+import hashlib
+import logging
+import os
+import sys
+import warnings
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import orjson
+import platformdirs
+
+from .errors import PushbutanError
+
+log = logging.getLogger("pushbutan")
+
+# How long a daemon has to answer a ping before commands run in-process instead, in seconds
+PING_TIMEOUT = 2
+
+# Pushbutan methods the daemon will run on a client's behalf
+_OPS = frozenset({
+    "list_workflows",
+    "get_latest_workflow_run",
+    "trigger_linux_gpu_instance",
+    "trigger_windows_gpu_instance",
+    "wait_for_instance",
+    "stop_instance",
+    "inspect_codesign_workflow",
+    "trigger_codesign",
+    "download_workflow_artifact",
+})
+
+# Ops returning githubkit models, which reach the client as plain JSON
+_MODEL_OPS = frozenset({"list_workflows", "get_latest_workflow_run"})
+
+# Connection whose request is being served, so its log records can be sent back
+_request_writer: contextvars.ContextVar = contextvars.ContextVar("request_writer")
+
+
+def socket_path() -> str:
+    """Path of the daemon's Unix socket, in the user runtime directory"""
+    with warnings.catch_warnings():
+        # Without XDG_RUNTIME_DIR (ssh sessions, containers, CI) platformdirs warns that
+        # it is using a temporary directory; the daemon and its clients agree on it anyway
+        warnings.simplefilter("ignore")
+        return os.path.join(platformdirs.user_runtime_dir("pushbutan"), "pushbutand.sock")
+
+def _token_key(token: Optional[str]) -> str:
+    """Short hash identifying a token, so the token itself never crosses the socket"""
+    return hashlib.blake2b((token or "").encode(), digest_size=8).hexdigest()
+
+def _to_json(obj: Any) -> Any:
+    """orjson fallback for the githubkit models in op results"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+def _encode(message: dict) -> bytes:
+    """Encode a message as one line of JSON"""
+    return orjson.dumps(message, default=_to_json, option=orjson.OPT_APPEND_NEWLINE)
+
+def _to_namespace(obj: Any) -> Any:
+    """Give JSON objects attribute access, standing in for the models they came from"""
+    if isinstance(obj, dict):
+        return SimpleNamespace(**{key: _to_namespace(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return [_to_namespace(item) for item in obj]
+    return obj
+
+
+class _ForwardHandler(logging.Handler):
+    """Send log records emitted while serving a request back to its client"""
+    def emit(self, record: logging.LogRecord):
+        writer = _request_writer.get(None)
+        if writer is None or writer.is_closing():
+            return
+        try:
+            writer.write(_encode({"log": self.format(record), "level": record.levelno}))
+        except Exception:
+            self.handleError(record)
+
+
+class DaemonClient:
+    """
+    Stand-in for Pushbutan that runs each call in the daemon
+
+    Supports the methods listed in _OPS, each over its own connection so
+    concurrent calls don't wait on each other.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or socket_path()
+
+    def __getattr__(self, op: str):
+        if op not in _OPS:
+            raise AttributeError(op)
+        return functools.partial(self._call, op)
+
+    async def _call(self, op: str, *args, **kwargs):
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        try:
+            writer.write(_encode({"op": op, "args": args, "kwargs": kwargs}))
+
+            async for line in reader:
+                message = orjson.loads(line)
+                if "log" in message:
+                    log.log(message["level"], message["log"])
+                elif "error" in message:
+                    raise PushbutanError(message["error"])
+                else:
+                    result = message["result"]
+                    return _to_namespace(result) if op in _MODEL_OPS else result
+
+            raise PushbutanError("Lost connection to the pushbutan daemon")
+        finally:
+            writer.close()
+
+    async def ping(self) -> bool:
+        """
+        Whether the daemon is up and using the same GitHub token as this process
+
+        Raises asyncio.TimeoutError if the daemon doesn't answer within PING_TIMEOUT.
+        """
+        async def ping() -> bool:
+            reader, writer = await asyncio.open_unix_connection(self.path)
+            try:
+                writer.write(_encode({"op": "ping"}))
+                response = orjson.loads(await reader.readline() or b"{}")
+                return response.get("result") == _token_key(os.getenv("GITHUB_TOKEN"))
+            finally:
+                writer.close()
+
+        return await asyncio.wait_for(ping(), PING_TIMEOUT)
+
+
+async def get_client():
+    """
+    Get a client for CLI commands: the daemon if one is running for this
+    token, otherwise the process-wide in-process Pushbutan client
+    """
+    if hasattr(asyncio, "open_unix_connection"):
+        client = DaemonClient()
+        if os.path.exists(client.path):
+            try:
+                if await client.ping():
+                    return client
+            except OSError:
+                pass  # Stale socket left behind by a daemon that has exited
+            except asyncio.TimeoutError:
+                log.warning(f"Pushbutan daemon at {client.path} is not responding, running in-process")
+
+    from .pushbutan import get_client
+    return await get_client()
+
+async def close_client() -> None:
+    """Close the in-process client, if this process opened one"""
+    pushbutan = sys.modules.get(f"{__package__}.pushbutan")
+    if pushbutan is not None:
+        await pushbutan.close_client()
+
+
+async def serve(path: Optional[str] = None) -> None:
+    """Serve Pushbutan calls on a Unix socket until cancelled"""
+    from .pushbutan import get_client
+
+    path = path or socket_path()
+    pb = await get_client()
+
+    handler = _ForwardHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(handler)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        _request_writer.set(writer)
+        try:
+            request = orjson.loads(await reader.readline())
+            op = request.get("op")
+            if op == "ping":
+                result = _token_key(pb.token)
+            elif op in _OPS:
+                result = await getattr(pb, op)(*request.get("args", ()), **request.get("kwargs", {}))
+            else:
+                raise PushbutanError(f"Unknown operation: {op}")
+            response = {"result": result}
+        except Exception as e:
+            response = {"error": str(e)}
+
+        try:
+            writer.write(_encode(response))
+            await writer.drain()
+        except ConnectionError:
+            pass  # The client went away before its result was ready
+        finally:
+            writer.close()
+
+    # Only this user may reach a daemon holding their GitHub token
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)
+    server = await asyncio.start_unix_server(handle, path)
+    os.chmod(path, 0o600)
+
+    log.info(f"Pushbutan daemon listening on {path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        log.removeHandler(handler)
+        if os.path.exists(path):
+            os.unlink(path)
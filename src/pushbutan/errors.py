@@ -0,0 +1,11 @@
+"""
+Exceptions raised by pushbutan
+
+Kept free of heavy imports so the CLI can handle errors from the daemon
+without loading the GitHub client.
+"""
+
+
+class PushbutanError(Exception):
+    """Base exception class for Pushbutan errors"""
+    pass
@@ -2,11 +2,26 @@
 
 from mcp.server.fastmcp import FastMCP
 from mcp import types
-from .pushbutan import Pushbutan, PushbutanError, InstanceType
+from .pushbutan import PushbutanError, get_client, close_client
+from .types import InstanceType, INSTANCE_TYPES
+from contextlib import asynccontextmanager
+import anyio
 import os
-import json
+import orjson
 
-mcp = FastMCP("Pushbutan")
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Keep one Pushbutan client (and its connection pool) open while serving"""
+    pb = await get_client()
+    try:
+        yield pb
+    finally:
+        await close_client()
+
+mcp = FastMCP("Pushbutan", lifespan=lifespan)
+
+# Instance types are fixed at import time, so serialize them once
+_INSTANCE_TYPES_JSON = orjson.dumps(list(INSTANCE_TYPES)).decode()
 
 @mcp.tool()
 def list_gpu_instance_types():
@@ -15,22 +30,22 @@ def list_gpu_instance_types():
     Returns:
         JSON string containing the list of available GPU instance types
     """
-    return json.dumps(list(InstanceType.__args__))
+    return _INSTANCE_TYPES_JSON
 
 @mcp.tool()
-def list_workflows():
+async def list_workflows():
     """ List all available workflows on the rocket-platform repo
 
     Returns:
         String representation of the available GitHub Actions workflows
     """
-    pb = Pushbutan()
-    workflows = pb.list_workflows()
+    pb = await get_client()
+    workflows = await pb.list_workflows()
     workflows = {workflow.name: workflow.id for workflow in workflows}
-    return json.dumps(workflows)
+    return orjson.dumps(workflows).decode()
 
 @mcp.tool()
-def start_linux_gpu_instance(instance_type: InstanceType, branch: str = "main", lifetime: int = 24):
+async def start_linux_gpu_instance(instance_type: InstanceType, branch: str = "main", lifetime: int = 24):
     """ Start a new Linux GPU instance
 
         Trigger creation of a Linux GPU instance
@@ -44,12 +59,12 @@ def start_linux_gpu_instance(instance_type: InstanceType, branch: str = "main",
             String representation of the workflow information. Use get_instance_status
             with the returned run_id to check instance status.
     """
-    pb = Pushbutan()
-    response = pb.trigger_linux_gpu_instance(instance_type, branch, str(lifetime))
-    return json.dumps(response)
+    pb = await get_client()
+    response = await pb.trigger_linux_gpu_instance(instance_type, branch, str(lifetime))
+    return orjson.dumps(response).decode()
 
 @mcp.tool()
-def stop_instance(instance_id: str):
+async def stop_instance(instance_id: str):
     """ Stop the current instance
 
     Args:
@@ -59,12 +74,12 @@ def stop_instance(instance_id: str):
         String representation of the workflow information. Use get_instance_status
         with the returned run_id to check stop status.
     """
-    pb = Pushbutan()
-    response = pb.stop_instance(instance_id=instance_id)
-    return json.dumps(response)
+    pb = await get_client()
+    response = await pb.stop_instance(instance_id=instance_id)
+    return orjson.dumps(response).decode()
 
 @mcp.tool()
-def get_instance_details(run_id: int):
+async def get_instance_details(run_id: int):
     """ Get the instance details from the job logs
 
     Args:
@@ -74,13 +89,32 @@ def get_instance_details(run_id: int):
         String representation of the instance details (ID, IP, etc)
         Will raise an error if logs cannot be parsed or instance details not found
     """
-    pb = Pushbutan()
-    logs = pb.get_run_logs(run_id)
-    instance_info = pb.extract_instance_details(logs)
-    return json.dumps(instance_info)
+    pb = await get_client()
+    instance_info = await pb.find_instance_details(run_id)
+    return orjson.dumps(instance_info).decode()
+
+def _failed_job_status(conclusion: str) -> str:
+    """get_job_status response for a completed run that didn't succeed"""
+    return orjson.dumps({
+        "status": "failed",
+        "error": f"Workflow failed with conclusion: {conclusion}"
+    }).decode()
+
+# get_job_status responses for completed runs, keyed by (status, conclusion)
+_JOB_STATUS_JSON = {
+    ("completed", "success"): orjson.dumps({
+        "status": "ready",
+        "message": "Workflow completed successfully"
+    }).decode(),
+    **{
+        ("completed", conclusion): _failed_job_status(conclusion)
+        for conclusion in ("failure", "cancelled", "timed_out", "action_required",
+                           "neutral", "skipped", "stale", "startup_failure")
+    },
+}
 
 @mcp.tool()
-def get_job_status(run_id: int):
+async def get_job_status(run_id: int):
     """ Get the status of a workflow run
 
     Args:
@@ -90,34 +124,34 @@ def get_job_status(run_id: int):
         String representation of the workflow status.
         Status will be one of: "ready", "in_progress", or "failed"
     """
-    pb = Pushbutan()
     try:
-        run = pb.get_workflow_run(run_id)
+        pb = await get_client()
+        run = await pb.get_workflow_run(run_id)
+
+        status = _JOB_STATUS_JSON.get((run.status, run.conclusion))
+        if status is not None:
+            return status
 
         if run.status == "completed":
-            if run.conclusion == "success":
-                return json.dumps({
-                    "status": "ready",
-                    "message": "Workflow completed successfully"
-                })
-            else:
-                return json.dumps({
-                    "status": "failed",
-                    "error": f"Workflow failed with conclusion: {run.conclusion}"
-                })
-        else:
-            return json.dumps({
-                "status": "in_progress",
-                "workflow_status": run.status,
-                "workflow_conclusion": run.conclusion
-            })
+            return _failed_job_status(run.conclusion)
+        return orjson.dumps({
+            "status": "in_progress",
+            "workflow_status": run.status,
+            "workflow_conclusion": run.conclusion
+        }).decode()
 
     except PushbutanError as e:
-        return json.dumps({
+        return orjson.dumps({
             "status": "failed",
             "error": str(e)
-        })
+        }).decode()
 
 def run_mcp_server():
     """Entry point for the MCP server"""
-    mcp.run()
\ No newline at end of file
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        # uvloop isn't available on Windows; serve on the default asyncio loop
+        mcp.run()
+    else:
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
\ No newline at end of file
@@ -1,32 +1,163 @@
 import os
-import json
-from typing import Optional, Literal
-from datetime import datetime, timezone
+import orjson
+from typing import Iterable, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+import httpx
 from githubkit import GitHub
-from githubkit.utils import Unset
+from githubkit.compat import type_validate_python
+from githubkit.exception import GitHubException, RateLimitExceeded, RequestError, RequestFailed
+from githubkit.typing import RetryOption
+try:
+    from githubkit_schemas.latest.models import Workflow, WorkflowRun
+except ImportError:  # older githubkit releases bundle their schemas
+    from githubkit.versions.latest.models import Workflow, WorkflowRun
+import platformdirs
+from .errors import PushbutanError
+from .types import ArchType, InstanceType, CudaVersion, ARCH_TYPES, INSTANCE_TYPES
+import asyncio
+import base64
+import functools
+import hashlib
+import inspect
+import random
 import time
-import io
+import re
+import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import sys
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+# Prefer RE2's linear-time automaton for scanning large logs, if installed
+try:
+    import re2 as log_regex
+except ImportError:
+    log_regex = re
+
+# Multiplex API requests over one HTTP/2 connection, if h2 is installed
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 log = logging.getLogger("pushbutan")
 
-class PushbutanError(Exception):
-    """Base exception class for Pushbutan errors"""
-    pass
+def _cache_path(name: str) -> str:
+    """Path of a file in the pushbutan user cache directory"""
+    return os.path.join(platformdirs.user_cache_dir("pushbutan"), name)
+
+def _load_cache(name: str) -> Optional[dict]:
+    """Load a JSON cache entry, or None if it's missing or unreadable"""
+    try:
+        with open(_cache_path(name), 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _save_cache(name: str, data: dict) -> None:
+    """Save a JSON cache entry; failing to write the cache is not an error"""
+    path = _cache_path(name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    except OSError as e:
+        log.debug(f"Could not write cache file {path}: {e}")
+
+# Instance details reported in the start-instance workflow logs. One
+# alternation lets a single finditer pass pick up every detail.
+_INSTANCE_DETAILS_PATTERN = (
+    r'INSTANCE_IDS:\s+(?P<instance_id>i-[a-f0-9]+)'
+    r'|\[\s*"(?P<ip_address>\d+\.\d+\.\d+\.\d+)"\s*\]'
+    r'|PLATFORM:\s+(?P<arch>' + '|'.join(map(re.escape, ARCH_TYPES)) + ')'
+    r'|INSTANCE_TYPE:\s+(?P<instance_type>' + '|'.join(map(re.escape, INSTANCE_TYPES)) + ')'
+)
+_INSTANCE_DETAILS_RE = log_regex.compile(_INSTANCE_DETAILS_PATTERN)
+_INSTANCE_DETAILS_BYTES_RE = log_regex.compile(_INSTANCE_DETAILS_PATTERN.encode())
+
+# Log archive entries for the step that starts the instance, which prints the details
+_INSTANCE_STEP_RE = re.compile(r'start.*instance', re.IGNORECASE)
+
+# Description of each instance detail, used when one can't be found
+_INSTANCE_DETAILS = {
+    "instance_id": "instance ID",
+    "ip_address": "IP address",
+    "arch": "platform",
+    "instance_type": "instance type",
+}
+
+def _scan_instance_details(logs: Union[str, bytes], found: dict) -> None:
+    """Record the first match in logs for each instance detail not already found"""
+    pattern = _INSTANCE_DETAILS_BYTES_RE if isinstance(logs, bytes) else _INSTANCE_DETAILS_RE
+    for match in pattern.finditer(logs):
+        key = match.lastgroup
+        if isinstance(key, bytes):
+            # RE2 names the groups of a bytes pattern with bytes
+            key = key.decode('ascii')
+        if key not in found:
+            # Each alternative has one group, so the last one matched holds the value
+            value = match.group(match.lastindex)
+            found[key] = value.decode('ascii') if isinstance(value, bytes) else value
+            if len(found) == len(_INSTANCE_DETAILS):
+                break
+
+def _instance_details(found: dict) -> dict:
+    """Build the instance details dict, failing if any detail is missing"""
+    for key, description in _INSTANCE_DETAILS.items():
+        if key not in found:
+            log.error(f"Could not find {description} in logs")
+            raise PushbutanError(f"Could not find {description} in workflow logs")
+
+    return {key: found[key] for key in _INSTANCE_DETAILS}
+
+class _RateLimitTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport that holds API requests while GitHub's rate limit is spent
 
-class GitHubEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle GitHub API response types"""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, Unset):
-            return None
-        return super().default(obj)
+    Every response's X-RateLimit-Remaining / X-RateLimit-Reset and Retry-After
+    headers are recorded. Once fewer than `reserve` calls remain, or GitHub has
+    asked for a pause, requests to the API wait for the limit to reset rather
+    than failing, unless that is more than `max_wait` seconds away.
+    """
+    def __init__(self, reserve: int, max_wait: float, **kwargs):
+        super().__init__(**kwargs)
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.host: Optional[str] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[int] = None
+        self.held_until = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Requests to other hosts (signed log and artifact URLs) don't count
+        if request.url.host == self.host:
+            wait = self.held_until - time.time()
+            if 0 < wait <= self.max_wait:
+                await asyncio.sleep(wait)
+
+        response = await super().handle_async_request(request)
+
+        headers = response.headers
+        if "X-RateLimit-Remaining" in headers and "X-RateLimit-Reset" in headers:
+            self.host = request.url.host
+            self.remaining = int(headers["X-RateLimit-Remaining"])
+            self.reset = int(headers["X-RateLimit-Reset"])
+            if self.remaining < self.reserve and self.held_until < self.reset:
+                # Logged once per rate limit window
+                self.held_until = self.reset
+                log.warning(f"Only {self.remaining} GitHub API calls left, holding requests until the rate limit resets")
+        # Only the API's own pauses hold API requests, not those of log or artifact storage
+        if request.url.host == self.host and headers.get("Retry-After", "").isdigit():
+            self.held_until = max(self.held_until, time.time() + int(headers["Retry-After"]))
+        return response
 
-ArchType = Literal["win-64", "linux-64"]
-InstanceType = Literal["g4dn.4xlarge", "p3.2xlarge"]
-CudaVersion = Literal["none", "12.4"]
 
 class Pushbutan:
     """
@@ -39,22 +170,189 @@ class Pushbutan:
     STOP_INSTANCE_WORKFLOW_ID = 31526129  # Agents: Stop instance
     CODESIGN_WORKFLOW_ID = 93334270  # Codesign Windows Package
 
+    # start_dev_instance arguments fixed by each kind of instance
+    INSTANCE_PROFILES = {
+        # Linux GPU instances require CUDA
+        "linux-gpu": {"arch": "linux-64", "cuda_version": "12.4"},
+        # Windows instances handle CUDA differently
+        "win-gpu": {"arch": "win-64", "cuda_version": "none"},
+    }
+
+    # Backoff while looking for a freshly dispatched run, in seconds
+    DISPATCH_POLL_INITIAL_DELAY = 0.5
+    DISPATCH_POLL_MAX_DELAY = 8
+    DISPATCH_POLL_TIMEOUT = 60
+
+    # Workflow run polling backoff, in seconds
+    POLL_INITIAL_DELAY = 1
+    POLL_MAX_DELAY = 30
+
+    # Below this many remaining API calls, polls are spread out until the rate limit resets
+    POLL_RATE_LIMIT_RESERVE = 100
+
+    # How long an in-progress workflow run is reused between callers, in seconds
+    RUN_CACHE_TTL = 1.0
+
+    # Log archives larger than this spill from memory to disk while scanning
+    LOG_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+    LOG_CHUNK_SIZE = 64 * 1024
+
+    # Instance details are logged near the end, so combined logs are searched from here first
+    LOG_TAIL_SIZE = 256 * 1024
+
+    # Artifacts at least this large are downloaded as parallel byte ranges
+    DOWNLOAD_RANGE_MIN_SIZE = 16 * 1024 * 1024
+    DOWNLOAD_PARTS = 8
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # Retries for rate limited, failed (5xx) and dropped API requests, in seconds
+    RETRY_MAX_ATTEMPTS = 5
+    RETRY_INITIAL_DELAY = 1
+    RETRY_MAX_DELAY = 60
+    RETRY_MAX_RATE_LIMIT_WAIT = 300
+
+    # Below this many remaining API calls, every request waits for the rate limit to reset
+    RATE_LIMIT_RESERVE = 50
+
+    # Connection pool shared by every request, keepalive expiry in seconds
+    HTTP_MAX_CONNECTIONS = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+    HTTP_KEEPALIVE_EXPIRY = 30
+
+    # How long the authenticated user's login is cached on disk, in seconds
+    USERNAME_CACHE_TTL = 24 * 60 * 60
+
+    # How many runs' instance details are kept on disk, most recently used first out
+    INSTANCE_DETAILS_CACHE_SIZE = 100
+
     def __init__(self, token: Optional[str] = None):
-        """Initialize Pushbutan with GitHub token"""
+        """
+        Initialize Pushbutan with GitHub token
+
+        The client must be entered with ``async with`` before use; this opens
+        the underlying HTTP connection pool.
+        """
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
             raise PushbutanError("GitHub token not provided and GITHUB_TOKEN env var not set")
 
-        self.gh = GitHub(self.token)
+        # Also tracks the rate limit for every request, see _RateLimitTransport
+        self._transport = _RateLimitTransport(
+            reserve=self.RATE_LIMIT_RESERVE,
+            max_wait=self.RETRY_MAX_RATE_LIMIT_WAIT,
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=self.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=self.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+
+        self.gh = GitHub(
+            self.token,
+            auto_retry=self._retry_decision,
+            # githubkit's in-memory cache would keep a copy of every streamed log and
+            # artifact for the life of the client; _cached_get revalidates on disk instead
+            http_cache=False,
+            async_transport=self._transport
+        )
+        self.username: Optional[str] = None
+
+        # In-flight wait_for_instance pollers and waiter counts, keyed by run ID
+        self._run_pollers: dict = {}
+        self._run_waiters: dict = {}
+
+        # Recent get_workflow_run fetches as (expiry, task), keyed by run ID
+        self._run_cache: dict = {}
+
+        # ETag and last fetched copy of each in-progress run, keyed by run ID
+        self._run_etags: dict = {}
+
+        # Dispatches return no run ID, so each workflow's dispatch and run lookup are
+        # serialized, and runs already matched to a dispatch are never matched again
+        self._dispatch_locks: dict = {}
+        self._claimed_runs: set = set()
+
+    def _retry_decision(self, exc: GitHubException, retry_count: int) -> RetryOption:
+        """Decide whether githubkit should retry a failed request, and after how long"""
+        if retry_count + 1 >= self.RETRY_MAX_ATTEMPTS:
+            return RetryOption(False)
+
+        if isinstance(exc, RateLimitExceeded):
+            # githubkit works out the wait from Retry-After or X-RateLimit-Reset
+            if exc.retry_after.total_seconds() > self.RETRY_MAX_RATE_LIMIT_WAIT:
+                return RetryOption(False)
+            log.warning(f"Rate limited by GitHub, retrying in {exc.retry_after.total_seconds():.0f}s")
+            return RetryOption(True, exc.retry_after)
+
+        if isinstance(exc, RequestFailed):
+            if exc.response.status_code == 401:
+                # Every failed request passes through here, so this is where a
+                # rejected token's cached login gets dropped
+                self._forget_username()
+            if exc.response.status_code < 500:
+                return RetryOption(False)
+            # A 502/504 from GitHub's edge may still have started a dispatched run
+            if exc.request.method not in ("GET", "HEAD"):
+                return RetryOption(False)
+        elif isinstance(exc, RequestError) and isinstance(exc.exc, httpx.TransportError):
+            # A dropped dispatch may still have started a run, so only resend safe requests
+            if exc.exc.request.method not in ("GET", "HEAD"):
+                return RetryOption(False)
+        else:
+            return RetryOption(False)
+
+        delay = min(self.RETRY_INITIAL_DELAY * 2 ** retry_count, self.RETRY_MAX_DELAY)
+        delay += random.uniform(0, delay / 4)
+        log.warning(f"GitHub request failed ({exc!r}), retrying in {delay:.1f}s")
+        return RetryOption(True, timedelta(seconds=delay))
+
+    async def __aenter__(self) -> "Pushbutan":
+        # Keep one HTTP client open for every request made inside the block
+        await self.gh.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.gh.__aexit__(exc_type, exc, tb)
+
+    def _token_key(self) -> str:
+        """Short hash identifying the token in the on-disk cache, which never stores the token itself"""
+        return hashlib.blake2b(self.token.encode(), digest_size=8).hexdigest()
+
+    async def get_username(self) -> str:
+        """
+        Get the authenticated user's login
+
+        Looked up on first use rather than on startup, and cached on disk per
+        token for USERNAME_CACHE_TTL so most invocations skip the request.
+        """
+        if self.username is not None:
+            return self.username
+
+        users = _load_cache("users.json") or {}
+        cached = users.get(self._token_key())
+        if cached and time.time() - cached["fetched_at"] < self.USERNAME_CACHE_TTL:
+            self.username = cached["login"]
+            return self.username
 
-        # Get current user's login
         try:
-            response = self.gh.rest.users.get_authenticated()
-            self.username = response.parsed_data.login
+            response = await self.gh.rest.users.async_get_authenticated()
         except Exception as e:
             raise PushbutanError(f"Failed to get authenticated user: {e}")
 
-    def start_dev_instance(self, arch: ArchType, instance_type: InstanceType,
+        self.username = response.parsed_data.login
+        users[self._token_key()] = {"login": self.username, "fetched_at": time.time()}
+        _save_cache("users.json", users)
+        return self.username
+
+    def _forget_username(self) -> None:
+        """Drop this token's cached login"""
+        self.username = None
+        users = _load_cache("users.json")
+        if users and users.pop(self._token_key(), None):
+            _save_cache("users.json", users)
+
+    async def start_dev_instance(self, arch: ArchType, instance_type: InstanceType,
                           cuda_version: CudaVersion, image_id: str = "latest",
                           branch: str = "main", lifetime: str = "24") -> dict:
         """Base method to trigger creation of a dev instance"""
@@ -68,43 +366,39 @@ class Pushbutan:
         }
 
         try:
-            start_time = datetime.now(timezone.utc)
-
-            # Trigger the workflow
-            response = self.gh.request(
-                "POST",
-                f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/workflows/{self.DEV_INSTANCE_WORKFLOW_ID}/dispatches",
-                json={
-                    "ref": "main",
-                    "inputs": inputs
-                }
-            )
-
-            # Find the new run
-            for attempt in range(20):
-                time.sleep(2)
-                runs = self.gh.rest.actions.list_workflow_runs(
-                    owner=self.REPO_OWNER,
-                    repo=self.REPO_NAME,
-                    workflow_id=self.DEV_INSTANCE_WORKFLOW_ID
-                ).parsed_data.workflow_runs
-
-                for run in runs:
-                    if (run.actor.login == self.username and
-                        run.created_at >= start_time):
-                        return {
-                            "run_id": run.id,
-                            "status": run.status,
-                            "created_at": run.created_at.isoformat(),
-                            "html_url": run.html_url
-                        }
+            # The run lookup needs the login; fail before dispatching rather than
+            # leave a started workflow untracked
+            await self.get_username()
+
+            # Dispatch and find the run before anyone else dispatches this workflow
+            async with self._dispatch_lock(self.DEV_INSTANCE_WORKFLOW_ID):
+                start_time = datetime.now(timezone.utc)
+
+                # Trigger the workflow
+                response = await self.gh.arequest(
+                    "POST",
+                    f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/workflows/{self.DEV_INSTANCE_WORKFLOW_ID}/dispatches",
+                    json={
+                        "ref": "main",
+                        "inputs": inputs
+                    }
+                )
 
-            raise PushbutanError("Could not find the triggered workflow run after multiple attempts")
+                # Find the new run
+                run = await self._find_triggered_run(self.DEV_INSTANCE_WORKFLOW_ID, start_time)
+            if run is None:
+                raise PushbutanError("Could not find the triggered workflow run after multiple attempts")
+            return {
+                "run_id": run.id,
+                "status": run.status,
+                "created_at": run.created_at.isoformat(),
+                "html_url": run.html_url
+            }
 
         except Exception as e:
             raise PushbutanError(f"Failed to trigger workflow: {str(e)}")
 
-    def trigger_linux_gpu_instance(self,
+    async def trigger_linux_gpu_instance(self,
                                  instance_type: InstanceType = "g4dn.4xlarge",
                                  branch: str = "main",
                                  lifetime: str = "24") -> dict:
@@ -119,15 +413,14 @@ class Pushbutan:
         Returns:
             Dict containing the workflow run information
         """
-        return self.start_dev_instance(
-            arch="linux-64",
+        return await self.start_dev_instance(
+            **self.INSTANCE_PROFILES["linux-gpu"],
             instance_type=instance_type,
-            cuda_version="12.4",  # Linux GPU instances require CUDA
             branch=branch,
             lifetime=lifetime
         )
 
-    def trigger_windows_gpu_instance(self,
+    async def trigger_windows_gpu_instance(self,
                                    instance_type: InstanceType = "g4dn.4xlarge",
                                    branch: str = "main",
                                    lifetime: str = "24") -> dict:
@@ -142,156 +435,516 @@ class Pushbutan:
         Returns:
             Dict containing the workflow run information
         """
-        return self.start_dev_instance(
-            arch="win-64",
+        return await self.start_dev_instance(
+            **self.INSTANCE_PROFILES["win-gpu"],
             instance_type=instance_type,
-            cuda_version="none",  # Windows instances handle CUDA differently
             branch=branch,
             lifetime=lifetime
         )
 
-    def list_workflows(self):
+    async def trigger_many(self, specs: List[dict], wait: bool = False,
+                           timeout_minutes: int = 15) -> List[Union[dict, PushbutanError]]:
+        """
+        Trigger several dev instances, then optionally wait on them in parallel
+
+        Dispatches are made one at a time so each run is matched to its own
+        inputs, but with wait=True the instances are provisioned and waited on
+        in parallel.
+
+        Args:
+            specs: Keyword arguments for start_dev_instance, one dict per instance
+            wait: Whether to also wait for each instance and return its details
+            timeout_minutes: How long to wait for each instance
+
+        Returns:
+            One result per spec, in order: the workflow run information (merged
+            with the instance details if waiting), or the PushbutanError that
+            stopped that instance. One failure doesn't cancel the others.
+        """
+        return await self._dispatch_many(
+            lambda spec: self.start_dev_instance(**spec),
+            specs,
+            functools.partial(self.wait_for_instance, timeout_minutes=timeout_minutes) if wait else None,
+            "trigger instance"
+        )
+
+    async def _dispatch_many(self, dispatch, items: list, wait, action: str) -> List[Union[dict, PushbutanError]]:
+        """
+        Dispatch a workflow run for each item, optionally waiting on each
+
+        Each dispatch holds its workflow's dispatch lock until its run is found,
+        so dispatches run one at a time; the waits all run in parallel.
+
+        Args:
+            dispatch: Coroutine function taking an item and returning its run information
+            items: The items to dispatch runs for
+            wait: Coroutine function taking a run ID and returning a dict to merge into
+                that run's result, or None to return once dispatched
+            action: What a dispatch does, for wrapping unexpected errors
+
+        Returns:
+            One result per item, in order, or the PushbutanError that stopped that item
+        """
+        async def run(item) -> dict:
+            result = await dispatch(item)
+            if wait is not None:
+                result.update(await wait(result["run_id"]))
+            return result
+
+        results = await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+        return [
+            PushbutanError(f"Failed to {action}: {r}")
+            if isinstance(r, Exception) and not isinstance(r, PushbutanError) else r
+            for r in results
+        ]
+
+    async def stop_instances(self, instance_ids: List[str], wait: bool = False,
+                             timeout_minutes: int = 15) -> List[Union[dict, PushbutanError]]:
+        """
+        Stop several instances sequentially, then optionally wait on them in parallel
+
+        Each stop is dispatched and its run found before the next is dispatched,
+        so each run is matched to its own instance; with wait=True the stop
+        workflows are then waited on in parallel.
+
+        Args:
+            instance_ids: The EC2 instance IDs to stop
+            wait: Whether to also wait for each stop workflow to complete
+            timeout_minutes: How long to wait for each stop workflow
+
+        Returns:
+            One result per instance ID, in order: the workflow run information
+            (merged with the success status if waiting), or the PushbutanError
+            that stopped that instance's workflow. One failure doesn't cancel the others.
+        """
+        return await self._dispatch_many(
+            self.stop_instance,
+            instance_ids,
+            functools.partial(self.wait_for_instance, timeout_minutes=timeout_minutes, parse_logs=False)
+            if wait else None,
+            "stop instance"
+        )
+
+    async def list_workflows(self):
         """List all available workflows in the repository"""
         try:
-            workflows = self.gh.rest.actions.list_repo_workflows(
+            workflows = await self._cached_get(
+                "workflows.json",
+                self.gh.rest.actions.async_list_repo_workflows,
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME
             )
-            return workflows.parsed_data.workflows
+            return type_validate_python(List[Workflow], workflows["workflows"])
         except Exception as e:
             raise PushbutanError(f"Failed to list workflows: {e}")
 
-    def get_workflow_run(self, run_id: int):
-        """Get details about a specific workflow run"""
+    async def _cached_get(self, cache_name: str, method, **kwargs) -> dict:
+        """
+        Call a githubkit GET method, revalidating a disk-cached body by ETag
+
+        If GitHub answers 304 Not Modified the cached JSON is returned without
+        transferring the body again.
+
+        Args:
+            cache_name: File name of the cache entry in the user cache dir
+            method: githubkit REST method to call
+            **kwargs: Arguments for the method
+
+        Returns:
+            The decoded JSON response body
+        """
+        cached = _load_cache(cache_name)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        response = await method(headers=headers, **kwargs)
+        if cached and response.status_code == 304:
+            return cached["data"]
+
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            _save_cache(cache_name, {"etag": etag, "data": data})
+        return data
+
+    async def get_workflow_run(self, run_id: int):
+        """
+        Get details about a specific workflow run
+
+        Concurrent callers share one request, and an in-progress run is reused
+        for RUN_CACHE_TTL seconds, so several pollers of the same run (e.g.
+        wait_for_instance and the MCP get_job_status tool) cost one API call.
+        """
+        entry = self._run_cache.get(run_id)
+        if entry is None or entry[0] <= time.monotonic():
+            fetch = asyncio.ensure_future(self._fetch_workflow_run(run_id))
+            entry = (time.monotonic() + self.RUN_CACHE_TTL, fetch)
+            self._run_cache[run_id] = entry
+            fetch.add_done_callback(lambda task: self._evict_workflow_run(run_id, task))
+
+        # Shield the shared fetch so a cancelled caller doesn't cancel it for the rest
+        return await asyncio.shield(entry[1])
+
+    def _evict_workflow_run(self, run_id: int, task: asyncio.Future) -> None:
+        """Drop a cached run fetch if it failed or the run has completed"""
+        if task.cancelled() or task.exception() is not None or task.result().status == "completed":
+            entry = self._run_cache.get(run_id)
+            if entry is not None and entry[1] is task:
+                del self._run_cache[run_id]
+
+    async def _fetch_workflow_run(self, run_id: int):
+        """
+        Fetch a workflow run from the API
+
+        Polls of an in-progress run send its last ETag, so an unchanged run
+        comes back as a bodiless 304 that doesn't count against the rate limit.
+        """
+        etag, cached = self._run_etags.get(run_id, (None, None))
         try:
-            response = self.gh.rest.actions.get_workflow_run(
+            response = await self.gh.rest.actions.async_get_workflow_run(
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME,
-                run_id=run_id
+                run_id=run_id,
+                headers={"If-None-Match": etag} if etag else None
             )
-            return response.parsed_data
+            if cached is not None and response.status_code == 304:
+                return cached
+
+            run = response.parsed_data
         except Exception as e:
             raise PushbutanError(f"Failed to get workflow run: {e}")
 
-    def get_latest_workflow_run(self):
-        """Get the most recent workflow run for our workflow"""
+        # A completed run won't be polled again
+        if run.status != "completed" and response.headers.get("ETag"):
+            self._run_etags[run_id] = (response.headers["ETag"], run)
+        else:
+            self._run_etags.pop(run_id, None)
+        return run
+
+    async def get_latest_workflow_run(self, workflow_id: Optional[int] = None):
+        """
+        Get the most recent run of a workflow (defaults to the dev instance workflow)
+
+        Returns None if the workflow has never run.
+        """
         try:
-            response = self.gh.rest.actions.list_workflow_runs(
+            response = await self.gh.rest.actions.async_list_workflow_runs(
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME,
-                workflow_id=self.DEV_INSTANCE_WORKFLOW_ID
+                workflow_id=workflow_id or self.DEV_INSTANCE_WORKFLOW_ID,
+                per_page=1
             )
-            runs = response.parsed_data.workflow_runs
-            if not runs:
-                raise PushbutanError("No workflow runs found")
-            return runs[0]  # Most recent run
         except Exception as e:
             raise PushbutanError(f"Failed to list workflow runs: {e}")
 
-    def get_run_logs(self, run_id: int, save_logs: bool = False) -> str:
+        runs = response.parsed_data.workflow_runs
+        return runs[0] if runs else None  # Most recent run
+
+    def _dispatch_lock(self, workflow_id: int) -> asyncio.Lock:
+        """Lock held from dispatching a workflow until its new run has been found"""
+        lock = self._dispatch_locks.get(workflow_id)
+        if lock is None:
+            lock = self._dispatch_locks[workflow_id] = asyncio.Lock()
+        return lock
+
+    async def _find_triggered_run(self, workflow_id: int, start_time: datetime):
         """
-        Get the logs for a specific workflow run
+        Find the run created by a workflow dispatch we just sent
 
-        Args:
-            run_id: The workflow run ID
-            save_logs: Whether to save logs to disk (default: False)
+        Dispatches don't return the run they create, so poll for our own run of the
+        workflow created since start_time, backing off until DISPATCH_POLL_TIMEOUT.
 
         Returns:
-            Combined log content as string
+            The workflow run, or None if it never showed up
         """
-        try:
-            # Download the logs (returns zip file content)
-            response = self.gh.rest.actions.download_workflow_run_logs(
+        username = await self.get_username()
+
+        # created_at is a whole-second UTC timestamp in this fixed format, so raw
+        # values can be compared with the start time as plain strings
+        start_iso = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+        started = time.monotonic()
+        deadline = started + self.DISPATCH_POLL_TIMEOUT
+        delay = self.DISPATCH_POLL_INITIAL_DELAY
+        attempt = 0
+        while True:
+            # Jitter keeps concurrent lookups from polling in lockstep
+            await asyncio.sleep(delay + random.uniform(0, 0.25))
+            attempt += 1
+
+            # Let the API narrow the listing down to our recent dispatches
+            response = await self.gh.rest.actions.async_list_workflow_runs(
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME,
-                run_id=run_id
+                workflow_id=workflow_id,
+                actor=username,
+                event="workflow_dispatch",
+                created=f">={start_iso}",
+                per_page=5
             )
 
-            # Create a BytesIO object from the response content
-            zip_bytes = io.BytesIO(response.content)
-
-            # Extract all text files from the zip
-            all_logs = []
-            with zipfile.ZipFile(zip_bytes) as zip_file:
-                for file_name in zip_file.namelist():
-                    if file_name.endswith('.txt'):
-                        log_content = zip_file.read(file_name).decode('utf-8')
-                        all_logs.append(log_content)
-
-                        # Save individual log files only if requested
-                        if save_logs:
-                            # Create logs directory if needed
-                            os.makedirs('logs', exist_ok=True)
-
-                            # Save individual log file
-                            log_path = f'logs/run_{run_id}_{file_name.replace("/", "_")}'
-                            with open(log_path, 'w') as f:
-                                f.write(log_content)
-                            log.info(f"Saved log file to: {log_path}")
-
-            # Combine all logs
-            combined_logs = '\n'.join(all_logs)
+            # Only the matching run is validated into a model; the rest are
+            # discarded after reading a few fields from the raw JSON
+            runs = orjson.loads(response.content)["workflow_runs"]
+
+            # API filtering has not always been reliable, so check the run locally too.
+            # Runs are listed newest first, so stop at the first one that predates us.
+            for run in runs:
+                if run["created_at"] < start_iso:
+                    break
+                if ((run.get("actor") or {}).get("login") == username and
+                    run["id"] not in self._claimed_runs):
+                    log.info(f"Found workflow run after {attempt} attempts ({time.monotonic() - started:.1f}s)")
+                    self._claimed_runs.add(run["id"])
+                    return type_validate_python(WorkflowRun, run)
+
+            if time.monotonic() + delay > deadline:
+                # Show what the last listing did return, to help debug
+                log.info(f"No matching run after {attempt} attempts ({time.monotonic() - started:.1f}s)")
+                log.info(f"Found {len(runs)} recent runs:")
+                for run in runs[:5]:
+                    log.info(f"Run ID: {run['id']}")
+                    log.info(f"Created: {run['created_at']}")
+                    log.info(f"Status: {run['status']}")
+                    log.info(f"Actor: {(run.get('actor') or {}).get('login')}")
+                return None
+            delay = min(delay * 2, self.DISPATCH_POLL_MAX_DELAY)
+
+    async def get_run_logs(self, run_id: int, save_logs: bool = False, logs_dir: str = 'logs') -> str:
+        """
+        Get the logs for a specific workflow run
 
-            # Save combined logs if requested
-            if save_logs:
-                combined_path = f'logs/run_{run_id}_combined.txt'
-                with open(combined_path, 'w') as f:
-                    f.write(combined_logs)
-                log.info(f"Saved combined logs to: {combined_path}")
+        Args:
+            run_id: The workflow run ID
+            save_logs: Whether to save logs to disk (default: False)
+            logs_dir: Directory to save logs in (default: logs)
 
-                # Save the original zip file
-                zip_path = f'logs/run_{run_id}.zip'
-                with open(zip_path, 'wb') as f:
-                    f.write(response.content)
-                log.info(f"Saved zip file to: {zip_path}")
+        Returns:
+            Combined log content as string
+        """
+        try:
+            with self._log_spool() as spool:
+                await self._download_run_logs(run_id, spool)
 
-            return combined_logs
+                # Unpacking (and saving) the archive blocks, so keep it off the event loop
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, self._read_log_archive, spool, run_id, save_logs, logs_dir
+                )
 
         except Exception as e:
             raise PushbutanError(f"Failed to get workflow run logs: {e}")
 
-    def extract_instance_details(self, logs: str) -> dict:
-        """Extract instance details from workflow logs"""
-        import re
-
-        log.info("Searching logs for instance details...")
+    def _read_log_archive(self, fileobj, run_id: int, save_logs: bool, logs_dir: str) -> str:
+        """Combine the logs in a zip archive, saving them under logs_dir if requested"""
+        if save_logs:
+            os.makedirs(logs_dir, exist_ok=True)
+
+        # Extract all text files from the zip
+        with zipfile.ZipFile(fileobj) as zip_file:
+            def read_log(file_name: str) -> str:
+                data = zip_file.read(file_name)
+
+                # Save individual log files only if requested, as the raw bytes
+                if save_logs:
+                    log_path = os.path.join(logs_dir, f'run_{run_id}_{file_name.replace("/", "_")}')
+                    with open(log_path, 'wb') as f:
+                        f.write(data)
+                    log.info(f"Saved log file to: {log_path}")
+
+                return data.decode('utf-8')
+
+            # ZipFile serializes reads of the underlying file, but inflating (which
+            # releases the GIL), decoding and saving each log can run in parallel
+            file_names = [name for name in zip_file.namelist() if name.endswith('.txt')]
+            with ThreadPoolExecutor() as executor:
+                all_logs = list(executor.map(read_log, file_names))
+
+        # Combine all logs
+        combined_logs = '\n'.join(all_logs)
+
+        # Save combined logs if requested
+        if save_logs:
+            combined_path = os.path.join(logs_dir, f'run_{run_id}_combined.txt')
+            with open(combined_path, 'w') as f:
+                f.write(combined_logs)
+            log.info(f"Saved combined logs to: {combined_path}")
+
+            # Save the original zip file
+            zip_path = os.path.join(logs_dir, f'run_{run_id}.zip')
+            fileobj.seek(0)
+            with open(zip_path, 'wb') as f:
+                shutil.copyfileobj(fileobj, f)
+            log.info(f"Saved zip file to: {zip_path}")
+
+        return combined_logs
+
+    def extract_instance_details(self, logs: Union[str, bytes, Iterable[Union[str, bytes]]]) -> dict:
+        """
+        Extract instance details from workflow logs
 
-        # Look for all instance details in the logs, ignoring timestamps
-        instance_id_match = re.search(r'.*INSTANCE_IDS:\s+(i-[a-f0-9]+)', logs, re.MULTILINE)
-        ip_match = re.search(r'.*\[ "(\d+\.\d+\.\d+\.\d+)" \]', logs, re.MULTILINE)
-        platform_match = re.search(r'.*PLATFORM:\s+(linux-64|win-64)', logs, re.MULTILINE)
-        instance_type_match = re.search(r'.*INSTANCE_TYPE:\s+(g4dn\.4xlarge|p3\.2xlarge)', logs, re.MULTILINE)
+        Args:
+            logs: The combined logs, or an iterable of log lines (such as an open
+                log file) to scan without holding every line in memory
 
-        if not instance_id_match:
-            log.error("Could not find instance ID in logs")
-            raise PushbutanError("Could not find instance ID in workflow logs")
+        Returns:
+            Dict containing the instance details
+        """
+        log.info("Searching logs for instance details...")
 
-        if not ip_match:
-            log.error("Could not find IP address in logs")
-            raise PushbutanError("Could not find IP address in workflow logs")
+        found = {}
+        if isinstance(logs, (str, bytes)):
+            # Try the tail of the logs before falling back to scanning all of them
+            if len(logs) > self.LOG_TAIL_SIZE:
+                _scan_instance_details(logs[-self.LOG_TAIL_SIZE:], found)
+            if len(found) < len(_INSTANCE_DETAILS):
+                _scan_instance_details(logs, found)
+        else:
+            for line in logs:
+                _scan_instance_details(line, found)
+                if len(found) == len(_INSTANCE_DETAILS):
+                    break
+        return _instance_details(found)
+
+    async def find_instance_details(self, run_id: int) -> dict:
+        """
+        Extract instance details from a workflow run's logs without buffering them
 
-        if not platform_match:
-            log.error("Could not find platform in logs")
-            raise PushbutanError("Could not find platform in workflow logs")
+        Each job's log is streamed and scanned as it arrives, stopping as soon
+        as every detail has been found. If the job logs don't have them all, the
+        run's log archive is streamed into a spooled temporary file and scanned
+        in chunks instead.
 
-        if not instance_type_match:
-            log.error("Could not find instance type in logs")
-            raise PushbutanError("Could not find instance type in workflow logs")
+        Args:
+            run_id: The workflow run ID
 
-        instance_id = instance_id_match.group(1)
-        ip_address = ip_match.group(1)
-        platform = platform_match.group(1)
-        instance_type = instance_type_match.group(1)
+        Returns:
+            Dict containing the instance details
+        """
+        # A finished run's logs never change, so neither do the details found in them
+        cache = _load_cache("instance_details.json") or {}
+        cached = cache.pop(str(run_id), None)
+        if cached is not None:
+            log.info(f"Using cached instance details for run {run_id}")
+            cache[str(run_id)] = cached
+            _save_cache("instance_details.json", cache)
+            return cached
 
+        log.info("Searching logs for instance details...")
 
-        return {
-            "instance_id": instance_id,
-            "ip_address": ip_address,
-            "arch": platform,
-            "instance_type": instance_type
-        }
+        try:
+            found = await self._scan_job_logs(run_id)
+        except Exception as e:
+            log.debug(f"Could not scan job logs for run {run_id}: {e}")
+            found = {}
+
+        if len(found) < len(_INSTANCE_DETAILS):
+            try:
+                with self._log_spool() as spool:
+                    await self._download_run_logs(run_id, spool)
+
+                    # Decompressing and scanning is CPU-bound, so keep it off the event loop
+                    found = await asyncio.get_running_loop().run_in_executor(
+                        None, self._scan_log_archive, spool
+                    )
+
+            except Exception as e:
+                raise PushbutanError(f"Failed to get workflow run logs: {e}")
+
+        details = _instance_details(found)
+        cache[str(run_id)] = details
+        for key in list(cache)[:-self.INSTANCE_DETAILS_CACHE_SIZE]:
+            del cache[key]
+        _save_cache("instance_details.json", cache)
+        return details
+
+    async def _scan_job_logs(self, run_id: int) -> dict:
+        """Scan every job's log in a run concurrently, stopping once every instance detail is found"""
+        response = await self.gh.rest.actions.async_list_jobs_for_workflow_run(
+            owner=self.REPO_OWNER,
+            repo=self.REPO_NAME,
+            run_id=run_id
+        )
 
-    def wait_for_instance(self, run_id: int, timeout_minutes: int = 15, parse_logs: bool = True, save_logs: bool = False) -> dict:
+        found = {}
+        tasks = [asyncio.create_task(self._scan_job_log(job.id, found)) for job in response.parsed_data.jobs]
+        try:
+            for task in asyncio.as_completed(tasks):
+                await task
+                if len(found) == len(_INSTANCE_DETAILS):
+                    break
+        finally:
+            # Stop any logs still streaming once the details are found (or one fails)
+            for task in tasks:
+                task.cancel()
+        return found
+
+    async def _scan_job_log(self, job_id: int, found: dict) -> None:
+        """Stream a job's plain text log, scanning whole lines until every instance detail is found"""
+        async with self.gh.get_async_client() as client:
+            async with client.stream(
+                "GET",
+                f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/jobs/{job_id}/logs",
+                follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                pending = b""
+                async for chunk in response.aiter_bytes(self.LOG_CHUNK_SIZE):
+                    chunk = pending + chunk
+                    end = chunk.rfind(b"\n") + 1
+                    pending = chunk[end:]
+                    _scan_instance_details(chunk[:end], found)
+                    if len(found) == len(_INSTANCE_DETAILS):
+                        return
+                _scan_instance_details(pending, found)
+
+    def _scan_log_archive(self, fileobj) -> dict:
+        """Scan the logs in a zip archive, stopping once every instance detail is found"""
+        found = {}
+        with zipfile.ZipFile(fileobj) as zip_file:
+            # Only the central directory has been read so far; inflate the start
+            # instance step first, and the other logs only if it falls short
+            file_names = [name for name in zip_file.namelist() if name.endswith('.txt')]
+            file_names.sort(key=lambda name: not _INSTANCE_STEP_RE.search(name))
+
+            for file_name in file_names:
+                with zip_file.open(file_name) as f:
+                    # Scan raw bytes, never decoding the logs, and only whole lines;
+                    # carry any partial line into the next chunk
+                    pending = b""
+                    for chunk in iter(lambda: f.read(self.LOG_CHUNK_SIZE), b""):
+                        chunk = pending + chunk
+                        end = chunk.rfind(b"\n") + 1
+                        pending = chunk[end:]
+                        _scan_instance_details(chunk[:end], found)
+                        if len(found) == len(_INSTANCE_DETAILS):
+                            return found
+                    _scan_instance_details(pending, found)
+
+                if len(found) == len(_INSTANCE_DETAILS):
+                    return found
+
+        return found
+
+    def _log_spool(self):
+        """Temporary file to stream a log archive into, kept in memory while it's small"""
+        # Before Python 3.11 a SpooledTemporaryFile has no seekable(), which ZipFile needs
+        if sys.version_info < (3, 11):
+            return tempfile.TemporaryFile()
+        return tempfile.SpooledTemporaryFile(max_size=self.LOG_SPOOL_MAX_SIZE)
+
+    async def _download_run_logs(self, run_id: int, fileobj) -> None:
+        """Stream a workflow run's log archive into a file object"""
+        async with self.gh.get_async_client() as client:
+            async with client.stream(
+                "GET",
+                f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/runs/{run_id}/logs",
+                follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(self.LOG_CHUNK_SIZE):
+                    fileobj.write(chunk)
+        fileobj.seek(0)
+
+    async def wait_for_instance(self, run_id: int, timeout_minutes: int = 15, parse_logs: bool = True, save_logs: bool = False,
+                                completed: Optional[asyncio.Event] = None, logs_dir: str = 'logs') -> dict:
         """
         Wait for a workflow run to complete
 
@@ -300,37 +953,95 @@ class Pushbutan:
             timeout_minutes: How long to wait before giving up
             parse_logs: Whether to parse logs for instance details (default: True)
             save_logs: Whether to save logs to disk for debugging (default: False)
+            completed: Optional event set by a workflow_run webhook receiver when the run
+                completes; wakes the poller immediately instead of waiting out its backoff
+            logs_dir: Directory to save logs in (default: logs)
 
         Returns:
             Dict with workflow results (instance details for start, success status for stop)
         """
         log.info(f"Waiting for workflow run {run_id} to complete...")
-        start_time = time.time()
-        timeout = timeout_minutes * 60
-
-        while time.time() - start_time < timeout:
-            run = self.get_workflow_run(run_id)
-            status = run.status
-            conclusion = run.conclusion
 
-            log.info(f"Status: {status} ({conclusion if conclusion else 'in progress'})")
+        # Concurrent waiters on the same run share a single poller task
+        poller = self._run_pollers.get(run_id)
+        if poller is None or poller.done():
+            poller = asyncio.create_task(self._poll_until_complete(run_id, completed))
+            self._run_pollers[run_id] = poller
+            poller.add_done_callback(lambda task: self._forget_poller(run_id, task))
+        self._run_waiters[run_id] = self._run_waiters.get(run_id, 0) + 1
 
-            if status == "completed":
-                if conclusion == "success":
-                    if parse_logs:
-                        # Get and parse the logs to extract instance details
-                        logs = self.get_run_logs(run_id, save_logs=save_logs)
-                        return self.extract_instance_details(logs)
-                    else:
-                        return {"success": True}
-                else:
-                    raise PushbutanError(f"Workflow failed with conclusion: {conclusion}")
-
-            time.sleep(30)  # Check every 30 seconds
-
-        raise PushbutanError(f"Timed out after {timeout_minutes} minutes")
-
-    def stop_instance(self, instance_id: str) -> dict:
+        try:
+            # Shield the poller so one waiter timing out doesn't cancel it for the others
+            async with async_timeout(timeout_minutes * 60):
+                run = await asyncio.shield(poller)
+        except asyncio.TimeoutError:
+            raise PushbutanError(f"Timed out after {timeout_minutes} minutes")
+        finally:
+            self._run_waiters[run_id] -= 1
+            if not self._run_waiters[run_id]:
+                del self._run_waiters[run_id]
+                # Unregister it now so a new waiter starts a fresh poller, not this cancelling one
+                self._forget_poller(run_id, poller)
+                poller.cancel()
+
+        if run.conclusion != "success":
+            raise PushbutanError(f"Workflow failed with conclusion: {run.conclusion}")
+
+        if parse_logs:
+            if save_logs:
+                # Get the full logs so they can be saved, then parse them
+                logs = await self.get_run_logs(run_id, save_logs=save_logs, logs_dir=logs_dir)
+                return self.extract_instance_details(logs)
+            return await self.find_instance_details(run_id)
+        return {"success": True}
+
+    def _forget_poller(self, run_id: int, task: asyncio.Task) -> None:
+        """Unregister a run's poller, unless it has already been replaced"""
+        if self._run_pollers.get(run_id) is task:
+            del self._run_pollers[run_id]
+
+    async def _poll_until_complete(self, run_id: int, completed: Optional[asyncio.Event] = None):
+        """Poll a workflow run with exponential backoff until it completes"""
+        delay = self.POLL_INITIAL_DELAY
+        while True:
+            run = await self.get_workflow_run(run_id)
+            log.info(f"Status: {run.status} ({run.conclusion if run.conclusion else 'in progress'})")
+
+            if run.status == "completed":
+                return run
+
+            # Back off towards the max interval, with jitter so waiters don't poll in lockstep
+            interval = self._rate_limited_interval(delay + random.uniform(0, delay / 4))
+            delay = min(delay * 2, self.POLL_MAX_DELAY)
+            if completed is None:
+                await asyncio.sleep(interval)
+                continue
+
+            try:
+                async with async_timeout(interval):
+                    await completed.wait()
+            except asyncio.TimeoutError:
+                continue
+
+            # The webhook can arrive before the API reports the run as completed,
+            # so go back to short polls rather than waiting on the event again
+            log.info(f"Workflow run {run_id} reported complete, checking status")
+            completed = None
+            delay = self.POLL_INITIAL_DELAY
+
+    def _rate_limited_interval(self, interval: float) -> float:
+        """Stretch a poll interval when the rate limit is nearly spent, so it lasts until reset"""
+        remaining, reset = self._transport.remaining, self._transport.reset
+        if remaining is None or remaining >= self.POLL_RATE_LIMIT_RESERVE:
+            return interval
+
+        paced = (reset - time.time()) / max(remaining, 1)
+        if paced > interval:
+            log.warning(f"Only {remaining} API calls left until the rate limit resets, polling every {paced:.0f}s")
+            return paced
+        return interval
+
+    async def stop_instance(self, instance_id: str) -> dict:
         """
         Trigger workflow to stop a dev instance
 
@@ -341,51 +1052,35 @@ class Pushbutan:
             Dict containing the workflow run information
         """
         try:
-            log.info(f"Triggering stop workflow for instance: {instance_id}")
-
-            # Trigger the workflow
-            response = self.gh.request(
-                "POST",
-                f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/workflows/{self.STOP_INSTANCE_WORKFLOW_ID}/dispatches",
-                json={
-                    "ref": "main",
-                    "inputs": {
-                        "instance_ids": instance_id
+            # The run lookup needs the login; fail before dispatching rather than
+            # leave a started workflow untracked
+            await self.get_username()
+
+            # Dispatch and find the run before anyone else dispatches this workflow
+            async with self._dispatch_lock(self.STOP_INSTANCE_WORKFLOW_ID):
+                start_time = datetime.now(timezone.utc)
+                log.info(f"Triggering stop workflow for instance: {instance_id}")
+
+                # Trigger the workflow
+                response = await self.gh.arequest(
+                    "POST",
+                    f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/workflows/{self.STOP_INSTANCE_WORKFLOW_ID}/dispatches",
+                    json={
+                        "ref": "main",
+                        "inputs": {
+                            "instance_ids": instance_id
+                        }
                     }
-                }
-            )
-
-            log.info(f"Response status: {response.status_code}")
-
-            # Get the run ID using similar logic to start_dev_instance
-            start_time = datetime.now(timezone.utc)
-            log.info("Waiting for workflow to start...")
-
-            # Initial sleep to give GitHub time to register the workflow
-            for _ in range(5):
-                time.sleep(1)
-
-            # Retry loop to find the new run
-            max_attempts = 20
-            attempt = 0
-            while attempt < max_attempts:
-                attempt += 1
+                )
 
-                runs = self.gh.rest.actions.list_workflow_runs(
-                    owner=self.REPO_OWNER,
-                    repo=self.REPO_NAME,
-                    workflow_id=self.STOP_INSTANCE_WORKFLOW_ID
-                ).parsed_data.workflow_runs
+                log.info(f"Response status: {response.status_code}")
 
-                for run in runs:
-                    if (run.actor.login == self.username and
-                        run.created_at >= start_time):
-                        log.info(f"Found workflow run after {attempt} attempts")
-                        return {"run_id": run.id}
-
-                time.sleep(2)
-
-            raise PushbutanError("Could not find the triggered workflow run after multiple attempts")
+                # Get the run ID using the same lookup as start_dev_instance
+                log.info("Waiting for workflow to start...")
+                run = await self._find_triggered_run(self.STOP_INSTANCE_WORKFLOW_ID, start_time)
+            if run is None:
+                raise PushbutanError("Could not find the triggered workflow run after multiple attempts")
+            return {"run_id": run.id}
 
         except Exception as e:
             log.error(f"Failed to stop instance: {instance_id}")
@@ -394,33 +1089,36 @@ class Pushbutan:
                 log.error(f"Response body: {e.response.text}")
             raise PushbutanError(f"Failed to trigger stop workflow: {e}")
 
-    def get_workflow_details(self, workflow_id: int):
+    async def get_workflow_details(self, workflow_id: int):
         """Get details about a specific workflow"""
         try:
             # First get the workflow metadata
-            workflow = self.gh.rest.actions.get_workflow(
+            workflow = await self._cached_get(
+                f"workflow_{workflow_id}.json",
+                self.gh.rest.actions.async_get_workflow,
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME,
                 workflow_id=workflow_id
-            ).parsed_data
+            )
 
-            log.info(f"Workflow path: {workflow.path}")
+            log.info(f"Workflow path: {workflow['path']}")
 
             # Then get the actual workflow file content
-            content = self.gh.rest.repos.get_content(
+            content = await self._cached_get(
+                f"workflow_{workflow_id}_content.json",
+                self.gh.rest.repos.async_get_content,
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME,
-                path=workflow.path
-            ).parsed_data
+                path=workflow["path"]
+            )
 
             # Content is base64 encoded
-            import base64
-            decoded_content = base64.b64decode(content.content).decode('utf-8')
+            decoded_content = base64.b64decode(content["content"]).decode('utf-8')
 
             return {
-                "id": workflow.id,
-                "name": workflow.name,
-                "path": workflow.path,
+                "id": workflow["id"],
+                "name": workflow["name"],
+                "path": workflow["path"],
                 "content": decoded_content
             }
 
@@ -431,17 +1129,17 @@ class Pushbutan:
                 log.error(f"Response body: {e.response.text}")
             raise PushbutanError(f"Failed to get workflow details: {e}")
 
-    def inspect_codesign_workflow(self) -> dict:
+    async def inspect_codesign_workflow(self) -> dict:
         """
         Get details about the codesign workflow and its expected inputs
         """
         try:
-            details = self.get_workflow_details(self.CODESIGN_WORKFLOW_ID)
+            details = await self.get_workflow_details(self.CODESIGN_WORKFLOW_ID)
             return details
         except Exception as e:
             raise PushbutanError(f"Failed to inspect codesign workflow: {e}")
 
-    def trigger_codesign(self, cert: str, org_channel: str, package_spec: Optional[str] = None,
+    async def trigger_codesign(self, cert: str, org_channel: str, package_spec: Optional[str] = None,
                         generate_repodata: bool = False) -> dict:
         """
         Trigger Windows package codesigning workflow
@@ -463,77 +1161,41 @@ class Pushbutan:
         }
 
         try:
-            # Create timezone-aware UTC datetime
-            start_time = datetime.now(timezone.utc)
-            log.info(f"Start time: {start_time.strftime('%Y-%m-%dT%H:%M:%SZ')}")
-            log.info(f"Current user: {self.username}")
-
-            log.info(f"Triggering workflow with inputs: {json.dumps(inputs, indent=2)}")
-
-            # Trigger the workflow
-            response = self.gh.request(
-                "POST",
-                f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/workflows/{self.CODESIGN_WORKFLOW_ID}/dispatches",
-                json={
-                    "ref": "main",
-                    "inputs": inputs
-                }
-            )
-
-            log.info(f"Response status: {response.status_code}")
-            log.info("Waiting for workflow to start")
-
-            # Initial sleep to give GitHub time to register the workflow
-            for _ in range(5):
-                time.sleep(1)
-
-            # Retry loop to find the new run
-            max_attempts = 20
-            attempt = 0
-            while attempt < max_attempts:
-                attempt += 1
-
-                # Get recent runs
-                runs = self.gh.rest.actions.list_workflow_runs(
-                    owner=self.REPO_OWNER,
-                    repo=self.REPO_NAME,
-                    workflow_id=self.CODESIGN_WORKFLOW_ID
-                ).parsed_data.workflow_runs
-
-                # Filter runs manually since the API filtering isn't reliable
-                for run in runs:
-                    if (run.actor.login == self.username and
-                        run.created_at >= start_time):  # Now comparing timezone-aware datetimes
-                        log.info(f"Found workflow run after {attempt} attempts")
-                        return {"run_id": run.id}
-
-                time.sleep(2)
-
-            # If we get here, show all runs to help debug
-            log.info("All recent workflow runs:")
-            all_runs = self.gh.rest.actions.list_workflow_runs(
-                owner=self.REPO_OWNER,
-                repo=self.REPO_NAME,
-                workflow_id=self.CODESIGN_WORKFLOW_ID
-            ).parsed_data.workflow_runs
-
-            log.info(f"Found {len(all_runs)} total runs:")
-            for run in all_runs[:5]:
-                log.info(f"Run ID: {run.id}")
-                log.info(f"Created: {run.created_at}")
-                log.info(f"Status: {run.status}")
-                log.info(f"Actor: {run.actor.login if run.actor else 'None'}")
+            # Dispatch and find the run before anyone else dispatches this workflow
+            async with self._dispatch_lock(self.CODESIGN_WORKFLOW_ID):
+                # Create timezone-aware UTC datetime
+                start_time = datetime.now(timezone.utc)
+                log.info(f"Start time: {start_time.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+                log.info(f"Current user: {await self.get_username()}")
+
+                # Let logging format the inputs only if debug output is enabled
+                log.debug("Triggering workflow with inputs: %s", inputs)
+
+                # Trigger the workflow
+                response = await self.gh.arequest(
+                    "POST",
+                    f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/workflows/{self.CODESIGN_WORKFLOW_ID}/dispatches",
+                    json={
+                        "ref": "main",
+                        "inputs": inputs
+                    }
+                )
 
-            raise PushbutanError("Could not find the triggered workflow run after multiple attempts")
+                log.info(f"Response status: {response.status_code}")
+                log.info("Waiting for workflow to start")
+                run = await self._find_triggered_run(self.CODESIGN_WORKFLOW_ID, start_time)
+            if run is None:
+                raise PushbutanError("Could not find the triggered workflow run after multiple attempts")
+            return {"run_id": run.id}
 
         except Exception as e:
-            log.error(f"Request failed with inputs: {json.dumps(inputs, indent=2)}")
+            log.error("Request failed with inputs: %s", inputs)
             if hasattr(e, 'response'):
                 log.error(f"Response status: {e.response.status_code}")
                 log.error(f"Response body: {e.response.text}")
             raise PushbutanError(f"Failed to trigger workflow: {e}")
 
-    def download_workflow_artifact(self, run_id: int, artifact_name: str, download_dir: str) -> str:
+    async def download_workflow_artifact(self, run_id: int, artifact_name: str, download_dir: str) -> str:
         """
         Download an artifact from a workflow run
 
@@ -547,36 +1209,188 @@ class Pushbutan:
         """
         try:
             # List artifacts for the run
-            artifacts = self.gh.rest.actions.list_workflow_run_artifacts(
+            artifacts = (await self.gh.rest.actions.async_list_workflow_run_artifacts(
                 owner=self.REPO_OWNER,
                 repo=self.REPO_NAME,
                 run_id=run_id
-            ).parsed_data.artifacts
+            )).parsed_data.artifacts
 
             # Find our artifact
             artifact = next((a for a in artifacts if a.name == artifact_name), None)
             if not artifact:
                 raise PushbutanError(f"Could not find artifact '{artifact_name}' in workflow run")
 
-            # Download the artifact
-            log.info(f"Downloading {artifact_name} ({artifact.size_in_bytes/1024/1024:.1f} MB)...")
-            response = self.gh.rest.actions.download_artifact(
-                owner=self.REPO_OWNER,
-                repo=self.REPO_NAME,
-                artifact_id=artifact.id,
-                archive_format="zip"
-            )
-
             # Create download directory
             os.makedirs(download_dir, exist_ok=True)
-
-            # Save the artifact
             artifact_path = os.path.join(download_dir, f"{artifact_name}.zip")
-            with open(artifact_path, 'wb') as f:
-                f.write(response.content)
+
+            # Artifacts uploaded with upload-artifact v4 or newer report a SHA256 digest
+            digest = artifact.digest if isinstance(artifact.digest, str) else None
+
+            # A run's artifacts never change, so a previous download that matches is reused
+            if digest and os.path.exists(artifact_path):
+                sha256 = await asyncio.get_running_loop().run_in_executor(None, self._hash_file, artifact_path)
+                if self._matches_digest(sha256, digest):
+                    log.info(f"Artifact already downloaded: {artifact_path}")
+                    return artifact_path
+
+            # Download the artifact
+            log.info(f"Downloading {artifact_name} ({artifact.size_in_bytes/1024/1024:.1f} MB)...")
+            async with self.gh.get_async_client() as client:
+                # GitHub redirects to a short-lived signed URL on blob storage
+                response = await client.get(
+                    f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/actions/artifacts/{artifact.id}/zip",
+                    follow_redirects=False
+                )
+                if not response.is_redirect:
+                    response.raise_for_status()
+                    raise PushbutanError(f"Expected a redirect to the artifact, got HTTP {response.status_code}")
+
+                await self._download_file(client, response.headers["Location"], artifact_path, digest)
 
             log.info(f"Saved artifact to: {artifact_path}")
             return artifact_path
 
         except Exception as e:
             raise PushbutanError(f"Failed to download artifact: {e}")
+
+    async def _download_file(self, client, url: str, path: str, digest: Optional[str] = None) -> None:
+        """
+        Download a signed blob URL to disk, in parallel ranges when possible
+
+        Large files are split into DOWNLOAD_PARTS byte ranges fetched
+        concurrently, each written at its offset as it streams in. If the
+        server doesn't honour Range requests the file is streamed in one go.
+        Given a "sha256:<hex>" digest, the downloaded file is checked against it.
+        """
+        # Signed URLs carry their own credentials; don't send the GitHub token
+        head = await client.head(url, auth=None)
+        size = int(head.headers.get("Content-Length", 0))
+
+        # Hosts may reject HEAD on a URL signed only for GET; then just stream the file
+        if head.is_success and head.headers.get("Accept-Ranges") == "bytes" and size >= self.DOWNLOAD_RANGE_MIN_SIZE:
+            part_size = -(-size // self.DOWNLOAD_PARTS)
+            with open(path, 'wb') as f:
+                f.truncate(size)
+
+                async def fetch_range(start: int) -> None:
+                    end = min(start + part_size, size) - 1
+                    async with client.stream("GET", url, headers={"Range": f"bytes={start}-{end}"}, auth=None) as response:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            raise _RangeNotSupported()
+                        offset = start
+                        async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                            f.seek(offset)
+                            f.write(chunk)
+                            offset += len(chunk)
+
+                tasks = [asyncio.ensure_future(fetch_range(start)) for start in range(0, size, part_size)]
+                try:
+                    await asyncio.gather(*tasks)
+                    ranged = True
+                except _RangeNotSupported:
+                    log.info("Server ignored range requests, downloading as a single stream")
+                    ranged = False
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+            if ranged:
+                if digest:
+                    # Ranges arrive out of order, so hash the finished file instead
+                    sha256 = await asyncio.get_running_loop().run_in_executor(None, self._hash_file, path)
+                    self._check_digest(path, digest, sha256)
+                return
+
+        sha256 = hashlib.sha256()
+        async with client.stream("GET", url, auth=None) as response:
+            response.raise_for_status()
+            with open(path, 'wb') as f:
+                async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    if digest:
+                        sha256.update(chunk)
+        if digest:
+            self._check_digest(path, digest, sha256)
+
+    def _hash_file(self, path: str):
+        """SHA256 of a file on disk, read in DOWNLOAD_CHUNK_SIZE chunks"""
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.DOWNLOAD_CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        return sha256
+
+    def _matches_digest(self, sha256, digest: str) -> bool:
+        """Whether a SHA256 hash matches a "sha256:<hex>" digest"""
+        return sha256.hexdigest() == digest.split(":", 1)[-1].lower()
+
+    def _check_digest(self, path: str, digest: str, sha256) -> None:
+        """Remove a download and fail if it doesn't match its expected digest"""
+        if not self._matches_digest(sha256, digest):
+            os.unlink(path)
+            raise PushbutanError(f"Downloaded file does not match digest {digest}")
+
+
+class SyncPushbutan:
+    """
+    Blocking front end to Pushbutan for callers without an event loop
+
+    Exposes the same coroutine methods as plain functions, e.g.
+    ``SyncPushbutan().trigger_linux_gpu_instance()``. Each call opens a
+    client and runs to completion on its own event loop. Plain methods such as
+    extract_instance_details are passed through.
+    """
+    def __init__(self, token: Optional[str] = None):
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        if not self.token:
+            raise PushbutanError("GitHub token not provided and GITHUB_TOKEN env var not set")
+
+    def __getattr__(self, name: str):
+        method = getattr(Pushbutan, name, None)
+        if name.startswith("_") or not inspect.isfunction(method):
+            raise AttributeError(name)
+
+        if not inspect.iscoroutinefunction(method):
+            # Plain methods make no requests, so the client is never opened
+            return getattr(Pushbutan(self.token), name)
+
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            async def run():
+                async with Pushbutan(self.token) as pb:
+                    return await getattr(pb, name)(*args, **kwargs)
+            return asyncio.run(run())
+        return call
+
+
+class _RangeNotSupported(Exception):
+    """Raised when a server answers a Range request with the whole body"""
+
+
+_client: Optional[Pushbutan] = None
+
+async def get_client() -> Pushbutan:
+    """
+    Get the process-wide Pushbutan client, opening it on first use
+
+    Sharing one client keeps a single pool of keep-alive connections to
+    GitHub instead of paying a TCP + TLS handshake per API call. githubkit
+    tracks the open HTTP client in a context variable, so call this first
+    from the outermost task (the CLI command or the MCP server lifespan).
+    """
+    global _client
+    if _client is None:
+        client = Pushbutan()
+        await client.__aenter__()
+        _client = client
+    return _client
+
+async def close_client() -> None:
+    """Close the process-wide Pushbutan client if one is open"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.__aexit__(None, None, None)
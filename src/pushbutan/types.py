@@ -0,0 +1,15 @@
+"""
+Instance options accepted by the rocket-platform dev instance workflow
+
+Kept free of heavy imports so the CLI can build its options without loading
+the GitHub client.
+"""
+
+from typing import Literal, get_args
+
+ArchType = Literal["win-64", "linux-64"]
+InstanceType = Literal["g4dn.4xlarge", "p3.2xlarge"]
+CudaVersion = Literal["none", "12.4"]
+
+ARCH_TYPES = get_args(ArchType)
+INSTANCE_TYPES = get_args(InstanceType)
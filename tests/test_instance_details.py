@@ -0,0 +1,36 @@
+import pytest
+
+from pushbutan import pushbutan
+
+LOG = (
+    b"2024 INSTANCE_IDS: i-0abc123\n"
+    b'2024 [ "10.0.0.1" ]\n'
+    b"PLATFORM: linux-64\n"
+    b"INSTANCE_TYPE: g4dn.4xlarge\n"
+)
+
+EXPECTED = {
+    "instance_id": "i-0abc123",
+    "ip_address": "10.0.0.1",
+    "arch": "linux-64",
+    "instance_type": "g4dn.4xlarge",
+}
+
+
+@pytest.mark.parametrize("logs", [LOG, LOG.decode()])
+def test_scan_instance_details(logs):
+    found = {}
+    pushbutan._scan_instance_details(logs, found)
+    assert pushbutan._instance_details(found) == EXPECTED
+
+
+@pytest.mark.parametrize("logs", [LOG, LOG.decode()])
+def test_scan_instance_details_re2(monkeypatch, logs):
+    re2 = pytest.importorskip("re2")
+    monkeypatch.setattr(pushbutan, "_INSTANCE_DETAILS_RE", re2.compile(pushbutan._INSTANCE_DETAILS_PATTERN))
+    monkeypatch.setattr(pushbutan, "_INSTANCE_DETAILS_BYTES_RE",
+                        re2.compile(pushbutan._INSTANCE_DETAILS_PATTERN.encode()))
+
+    found = {}
+    pushbutan._scan_instance_details(logs, found)
+    assert pushbutan._instance_details(found) == EXPECTED